@@ -14,25 +14,24 @@
 
 __revision__ = '$Id$'
 
-import urllib
-import urllib2
-if not hasattr(urllib2, 'splituser'):
-    # setuptools wants to import this from urllib2 but it's not
-    # in there in Python 2.3.3, so we just alias it.
-    urllib2.splituser = urllib.splituser
-
-from ez_setup import use_setuptools
-use_setuptools()
-
 import os
 import sys
 
 if sys.version_info[:2] < (2, 3):
-    msg = ("supervisor requires Python 2.3 or better, you are attempting to "
-           "install it using version %s.  Please install with a "
-           "supported version" % sys.version)
-    sys.stderr.write(msg)
-    sys.exit(1)
+    sys.exit("supervisor requires Python 2.3 or better, you are attempting to "
+             "install it using version %s.  Please install with a "
+             "supported version" % sys.version)
+
+if sys.version_info[:2] < (2, 4):
+    import urllib
+    import urllib2
+    if not hasattr(urllib2, 'splituser'):
+        # setuptools wants to import this from urllib2 but it's not
+        # in there in Python 2.3.3, so we just alias it.
+        urllib2.splituser = urllib.splituser
+
+from ez_setup import use_setuptools
+use_setuptools()
 
 requires = ['meld3 >= 0.6.5']
 
@@ -23,10 +23,16 @@ from supervisor.states import EventListenerStates
 from supervisor import loggers
 
 def find_prefix_at_end(haystack, needle):
-    l = len(needle) - 1
-    while l and not haystack.endswith(needle[:l]):
-        l -= 1
-    return l
+    # only the last len(needle) - 1 characters of haystack can hold a
+    # prefix of needle, and any such prefix starts with needle[0]; that
+    # character is usually absent, so we rarely get past the first find()
+    first = needle[0]
+    start = haystack.find(first, max(0, len(haystack) - len(needle) + 1))
+    while start != -1:
+        if needle.startswith(haystack[start:]):
+            return len(haystack) - start
+        start = haystack.find(first, start + 1)
+    return 0
 
 class PDispatcher:
     """ Asyncore dispatcher for mainloop, representing a process channel
@@ -146,13 +152,14 @@ class POutputDispatcher(PDispatcher):
     def _log(self, data):
         if data:
             config = self.process.config
-            if config.options.strip_ansi:
+            options = config.options
+            if options.strip_ansi:
                 data = stripEscapes(data)
             if self.childlog:
                 self.childlog.info(data)
             if self.log_to_mainlog:
                 msg = '%(name)r %(channel)s output:\n%(data)s'
-                config.options.logger.log(
+                options.logger.log(
                     self.mainlog_level, msg, name=config.name,
                     channel=self.channel, data=data)
             if self.channel == 'stdout':
@@ -176,33 +183,34 @@ class POutputDispatcher(PDispatcher):
             self._log(data)
             return
             
-        if self.capturemode:
-            token, tokenlen = self.endtoken_data
-        else:
-            token, tokenlen = self.begintoken_data
+        # loop rather than recurse when a single buffer holds more
+        # than one capture token
+        while 1:
+            if self.capturemode:
+                token, tokenlen = self.endtoken_data
+            else:
+                token, tokenlen = self.begintoken_data
 
-        if len(self.output_buffer) <= tokenlen:
-            return # not enough data
+            if len(self.output_buffer) <= tokenlen:
+                return # not enough data
 
-        data = self.output_buffer
-        self.output_buffer = ''
+            data = self.output_buffer
+            self.output_buffer = ''
 
-        try:
-            before, after = data.split(token, 1)
-        except ValueError:
-            after = None
-            index = find_prefix_at_end(data, token)
-            if index:
-                self.output_buffer = self.output_buffer + data[-index:]
-                data = data[:-index]
-            self._log(data)
-        else:
-            self._log(before)
-            self.toggle_capturemode()
-            self.output_buffer = after
+            # most reads won't contain the token; find() lets us avoid
+            # raising and catching a ValueError from split() for each one
+            index = data.find(token)
+            if index == -1:
+                index = find_prefix_at_end(data, token)
+                if index:
+                    self.output_buffer = self.output_buffer + data[-index:]
+                    data = data[:-index]
+                self._log(data)
+                return
 
-        if after:
-            self.record_output()
+            self._log(data[:index])
+            self.toggle_capturemode()
+            self.output_buffer = data[index+tokenlen:]
 
     def toggle_capturemode(self):
         self.capturemode = not self.capturemode
@@ -308,8 +316,11 @@ class PEventListenerDispatcher(PDispatcher):
         if data:
             self.state_buffer += data
             procname = self.process.config.name
-            msg = '%r %s output:\n%s' % (procname, self.channel, data)
-            self.process.config.options.logger.debug(msg)
+            # let the logger interpolate, so we don't copy data into a
+            # message string when debug logging is off
+            msg = '%(procname)r %(channel)s output:\n%(data)s'
+            self.process.config.options.logger.debug(
+                msg, procname=procname, channel=self.channel, data=data)
 
             if self.childlog:
                 if self.process.config.options.strip_ansi:
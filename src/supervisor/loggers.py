@@ -82,13 +82,26 @@ class Handler:
                 return
         self.stream.close()
 
+    def format(self, record):
+        if self.fmt == '%(message)s':
+            # process output logs use this format; don't bother computing
+            # a timestamp that won't be used
+            return record.getMessage()
+        return self.fmt % record.asdict()
+
+    def _write(self, msg):
+        # returns what was actually written to the stream
+        try:
+            self.stream.write(msg)
+        except UnicodeError:
+            msg = msg.encode("UTF-8")
+            self.stream.write(msg)
+        return msg
+
     def emit(self, record):
         try:
-            msg = self.fmt % record.asdict()
-            try:
-                self.stream.write(msg)
-            except UnicodeError:
-                self.stream.write(msg.encode("UTF-8"))
+            msg = self.format(record)
+            self._write(msg)
             self.flush()
         except:
             self.handleError(record)
@@ -182,6 +195,22 @@ class RotatingFileHandler(FileHandler):
         self.backupCount = backupCount
         self.counter = 0
         self.every = 10
+        self.size = self.getsize()
+
+    def getsize(self):
+        # the size of the current file, used to seed our running byte count
+        # so that we don't need to ask the stream for its position on
+        # every emit
+        return os.fstat(self.stream.fileno()).st_size
+
+    def reopen(self):
+        FileHandler.reopen(self)
+        self.size = self.getsize()
+
+    def _write(self, msg):
+        msg = FileHandler._write(self, msg)
+        self.size = self.size + len(msg)
+        return msg
 
     def emit(self, record):
         """
@@ -200,33 +229,27 @@ class RotatingFileHandler(FileHandler):
         if self.maxBytes <= 0:
             return
 
-        if not (self.stream.tell() >= self.maxBytes):
+        if not (self.size >= self.maxBytes):
             return
 
         self.stream.close()
         if self.backupCount > 0:
+            # each step's source name is the next step's destination name
+            dfn = "%s.%d" % (self.baseFilename, self.backupCount)
             for i in range(self.backupCount - 1, 0, -1):
                 sfn = "%s.%d" % (self.baseFilename, i)
-                dfn = "%s.%d" % (self.baseFilename, i + 1)
-                if os.path.exists(sfn):
-                    if os.path.exists(dfn):
-                        try:
-                            os.remove(dfn)
-                        except OSError, why:
-                            # catch race condition (already deleted)
-                            if why[0] != errno.ENOENT:
-                                raise
-                    os.rename(sfn, dfn)
-            dfn = self.baseFilename + ".1"
-            if os.path.exists(dfn):
+                # rename() atomically replaces an existing dfn, so there's
+                # no need to check for or remove it first
                 try:
-                    os.remove(dfn)
+                    os.rename(sfn, dfn)
                 except OSError, why:
-                    # catch race condition (already deleted)
+                    # sfn doesn't exist (yet)
                     if why[0] != errno.ENOENT:
                         raise
+                dfn = sfn
             os.rename(self.baseFilename, dfn)
         self.stream = open(self.baseFilename, 'w')
+        self.size = 0
 
 class LogRecord:
     def __init__(self, level, msg, **kw):
@@ -235,6 +258,11 @@ class LogRecord:
         self.kw = kw
         self.dictrepr = None
 
+    def getMessage(self):
+        if self.kw:
+            return self.msg % self.kw
+        return self.msg
+
     def asdict(self):
         if self.dictrepr is None:
             now = time.time()
@@ -242,10 +270,7 @@ class LogRecord:
             part1 = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
             asctime = '%s,%03d' % (part1, msecs)
             levelname = LOG_LEVELS_BY_NUM[self.level]
-            if self.kw:
-                msg = self.msg % self.kw
-            else:
-                msg = self.msg
+            msg = self.getMessage()
             self.dictrepr = {'message':msg, 'levelname':levelname,
                              'asctime':asctime}
         return self.dictrepr
@@ -17,13 +17,10 @@ import socket
 import getopt
 import os
 import sys
-import tempfile
 import errno
 import signal
 import re
 import xmlrpclib
-import pwd
-import grp
 import resource
 import stat
 import pkg_resources
@@ -92,7 +89,7 @@ class Options:
 
     def __init__(self):
         self.names_list = []
-        self.short_options = []
+        self.short_options = ''
         self.long_options = []
         self.options_map = {}
         self.default_map = {}
@@ -169,41 +166,41 @@ class Options:
 
         if flag is not None:
             if handler is not None:
-                raise ValueError, "use at most one of flag= and handler="
+                raise ValueError("use at most one of flag= and handler=")
             if not long and not short:
-                raise ValueError, "flag= requires a command line flag"
+                raise ValueError("flag= requires a command line flag")
             if short and short.endswith(":"):
-                raise ValueError, "flag= requires a command line flag"
+                raise ValueError("flag= requires a command line flag")
             if long and long.endswith("="):
-                raise ValueError, "flag= requires a command line flag"
+                raise ValueError("flag= requires a command line flag")
             handler = lambda arg, flag=flag: flag
 
         if short and long:
             if short.endswith(":") != long.endswith("="):
-                raise ValueError, "inconsistent short/long options: %r %r" % (
-                    short, long)
+                raise ValueError("inconsistent short/long options: %r %r" % (
+                    short, long))
 
         if short:
             if short[0] == "-":
-                raise ValueError, "short option should not start with '-'"
+                raise ValueError("short option should not start with '-'")
             key, rest = short[:1], short[1:]
             if rest not in ("", ":"):
-                raise ValueError, "short option should be 'x' or 'x:'"
+                raise ValueError("short option should be 'x' or 'x:'")
             key = "-" + key
-            if self.options_map.has_key(key):
-                raise ValueError, "duplicate short option key '%s'" % key
+            if key in self.options_map:
+                raise ValueError("duplicate short option key '%s'" % key)
             self.options_map[key] = (name, handler)
-            self.short_options.append(short)
+            self.short_options = self.short_options + short
 
         if long:
             if long[0] == "-":
-                raise ValueError, "long option should not start with '-'"
+                raise ValueError("long option should not start with '-'")
             key = long
             if key[-1] == "=":
                 key = key[:-1]
             key = "--" + key
-            if self.options_map.has_key(key):
-                raise ValueError, "duplicate long option key '%s'" % key
+            if key in self.options_map:
+                raise ValueError("duplicate long option key '%s'" % key)
             self.options_map[key] = (name, handler)
             self.long_options.append(long)
 
@@ -253,7 +250,7 @@ class Options:
         # Call getopt
         try:
             self.options, self.args = getopt.getopt(
-                args, "".join(self.short_options), self.long_options)
+                args, self.short_options, self.long_options)
         except getopt.error, msg:
             if raise_getopt_errs:
                 self.usage(msg)
@@ -276,9 +273,8 @@ class Options:
                 self._set(name, arg, 2)
 
         # Process environment variables
-        for envvar in self.environ_map.keys():
-            name, handler = self.environ_map[envvar]
-            if os.environ.has_key(envvar):
+        for envvar, (name, handler) in self.environ_map.items():
+            if envvar in os.environ:
                 value = os.environ[envvar]
                 if handler is not None:
                     try:
@@ -374,6 +370,7 @@ class ServerOptions(Options):
     mood = states.SupervisorStates.RUNNING
     
     def __init__(self):
+        import tempfile
         Options.__init__(self)
         self.configroot = Dummy()
         self.configroot.supervisord = Dummy()
@@ -519,7 +516,7 @@ class ServerOptions(Options):
 
         sections = parser.sections()
         if not 'supervisord' in sections:
-            raise ValueError, '.ini file does not include supervisord section'
+            raise ValueError('.ini file does not include supervisord section')
         get = parser.getdefault
         section.minfds = integer(get('minfds', 1024))
         section.minprocs = integer(get('minprocs', 200))
@@ -540,6 +537,7 @@ class ServerOptions(Options):
         section.identifier = get('identifier', 'supervisor')
         section.nodaemon = boolean(get('nodaemon', 'false'))
 
+        import tempfile
         tempdir = tempfile.gettempdir()
         section.childlogdir = existing_directory(get('childlogdir', tempdir))
         section.nocleanup = boolean(get('nocleanup', 'false'))
@@ -724,7 +722,7 @@ class ServerOptions(Options):
 
         command = get(section, 'command', None)
         if command is None:
-            raise ValueError, (
+            raise ValueError(
                 'program section %s does not specify a command' % section)
 
         if numprocs > 1:
@@ -1027,13 +1025,14 @@ class ServerOptions(Options):
     def clear_autochildlogdir(self):
         # must be called after realize()
         childlogdir = self.childlogdir
-        fnre = re.compile(r'.+?---%s-\S+\.log\.{0,1}\d{0,4}' % self.identifier)
         try:
             filenames = os.listdir(childlogdir)
         except (IOError, OSError):
             self.logger.warn('Could not clear childlog dir')
             return
-        
+
+        fnre = re.compile(r'.+?---%s-\S+\.log\.{0,1}\d{0,4}' %
+                          re.escape(self.identifier))
         for filename in filenames:
             if fnre.match(filename):
                 pathname = os.path.join(childlogdir, filename)
@@ -1048,11 +1047,7 @@ class ServerOptions(Options):
     def cleanup_fds(self):
         # try to close any leaked file descriptors (for reload)
         start = 5
-        for x in range(start, self.minfds):
-            try:
-                os.close(x)
-            except OSError:
-                pass
+        self.close_fds(start, self.minfds)
 
     def select(self, r, w, x, timeout):
         return select.select(r, w, x, timeout)
@@ -1071,6 +1066,8 @@ class ServerOptions(Options):
         return msg
 
     def dropPrivileges(self, user):
+        import pwd
+        import grp
         # Drop root privileges if we have them
         if user is None:
             return "No used specified to setuid to!"
@@ -1208,6 +1205,16 @@ class ServerOptions(Options):
         except OSError:
             pass
 
+    def close_fds(self, low, high):
+        # close every fd from low up to (but not including) high, ignoring
+        # errors; os.closerange (Python 2.6+) does this without a Python
+        # level call per fd, which matters between fork and exec
+        if hasattr(os, 'closerange'):
+            os.closerange(low, high)
+        else:
+            for fd in range(low, high):
+                self.close_fd(fd)
+
     def fork(self):
         return os.fork()
 
@@ -1227,6 +1234,7 @@ class ServerOptions(Options):
         return os.execve(filename, argv, env)
 
     def mktempfile(self, suffix, prefix, dir):
+        import tempfile
         # set os._urandomfd as a hack around bad file descriptor bug
         # seen in the wild, see
         # http://www.plope.com/software/collector/252
@@ -1250,7 +1258,7 @@ class ServerOptions(Options):
     def get_path(self):
         """Return a list corresponding to $PATH, or a default."""
         path = ["/bin", "/usr/bin", "/usr/local/bin"]
-        if os.environ.has_key("PATH"):
+        if "PATH" in os.environ:
             p = os.environ["PATH"]
             if p:
                 path = p.split(os.pathsep)
@@ -1386,7 +1394,8 @@ class ClientOptions(Options):
         config.readfp(fp)
         sections = config.sections()
         if not 'supervisorctl' in sections:
-            raise ValueError,'.ini file does not include supervisorctl section' 
+            raise ValueError(
+                '.ini file does not include supervisorctl section')
         serverurl = config.getdefault('serverurl', 'http://localhost:9001')
         if serverurl.startswith('unix://'):
             sf = serverurl[7:]
@@ -1432,7 +1441,7 @@ class ClientOptions(Options):
                                                    self.serverurl)
             )
 
-_marker = []
+_marker = object()
 
 class UnhosedConfigParser(ConfigParser.RawConfigParser):
     mysection = 'supervisord'
@@ -1442,22 +1451,14 @@ class UnhosedConfigParser(ConfigParser.RawConfigParser):
         return self.readfp(s)
     
     def getdefault(self, option, default=_marker):
-        try:
-            return self.get(self.mysection, option)
-        except ConfigParser.NoOptionError:
-            if default is _marker:
-                raise
-            else:
-                return default
+        return self.saneget(self.mysection, option, default)
 
     def saneget(self, section, option, default=_marker):
-        try:
+        # most options are left out of most sections, so check for the
+        # option rather than paying for a NoOptionError each time
+        if default is _marker or self.has_option(section, option):
             return self.get(section, option)
-        except ConfigParser.NoOptionError:
-            if default is _marker:
-                raise
-            else:
-                return default
+        return default
 
 class Config:
     def __cmp__(self, other):
@@ -1658,8 +1659,7 @@ def readFile(filename, offset, length):
             # negative offset returns offset bytes from tail of the file
             if length:
                 raise ValueError('BAD_ARGUMENTS')
-            f.seek(0, 2)
-            sz = f.tell()
+            sz = os.fstat(f.fileno()).st_size
             pos = int(sz - absoffset)
             if pos < 0:
                 pos = 0
@@ -1690,8 +1690,7 @@ def tailFile(filename, offset, length):
     overflow = False
     try:
         f = open(filename, 'rb')
-        f.seek(0, 2)
-        sz = f.tell()
+        sz = os.fstat(f.fileno()).st_size
 
         if sz > (offset + length):
             overflow = True
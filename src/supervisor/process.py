@@ -17,7 +17,6 @@ import sys
 import time
 import errno
 import shlex
-import StringIO
 import traceback
 import signal
 
@@ -279,8 +278,7 @@ class Subprocess:
             options.dup2(self.pipes['child_stdout'], 2)
         else:
             options.dup2(self.pipes['child_stderr'], 2)
-        for i in range(3, options.minfds):
-            options.close_fd(i)        
+        options.close_fds(3, options.minfds)
 
     def _spawn_as_child(self, filename, argv):
         options = self.config.options
@@ -384,9 +382,8 @@ class Subprocess:
         try:
             options.kill(self.pid, sig)
         except:
-            io = StringIO.StringIO()
-            traceback.print_exc(file=io)
-            tb = io.getvalue()
+            # traceback.format_exc() is new in Python 2.4
+            tb = ''.join(traceback.format_exception(*sys.exc_info()))
             msg = 'unknown problem killing %s (%s):%s' % (self.config.name,
                                                           self.pid, tb)
             options.logger.critical(msg)
@@ -609,8 +606,7 @@ class FastCGISubprocess(Subprocess):
             options.dup2(self.pipes['child_stdout'], 2)
         else:
             options.dup2(self.pipes['child_stderr'], 2)
-        for i in range(3, options.minfds):
-            options.close_fd(i)
+        options.close_fds(3, options.minfds)
                 
 class ProcessGroupBase:
     def __init__(self, config):
@@ -665,13 +661,13 @@ class ProcessGroupBase:
 
     def get_dispatchers(self):
         dispatchers = {}
-        for process in self.processes.values():
+        for process in self.processes.itervalues():
             dispatchers.update(process.dispatchers)
         return dispatchers
 
 class ProcessGroup(ProcessGroupBase):
     def transition(self):
-        for proc in self.processes.values():
+        for proc in self.processes.itervalues():
             proc.transition()
             
 class FastCGIProcessGroup(ProcessGroup):
@@ -716,9 +712,8 @@ class EventListenerPool(ProcessGroupBase):
             self._acceptEvent(event.event, head=True)
 
     def transition(self):
-        processes = self.processes.values()
         dispatch_capable = False
-        for process in processes:
+        for process in self.processes.itervalues():
             process.transition()
             # this is redundant, we do it in _dispatchEvent too, but we
             # want to reduce function call overhead
@@ -15,6 +15,15 @@
 # This module must not depend on any other non-stdlib module to prevent
 # circular import problems.
 
+def _names_by_code(states):
+    # reverse mapping of a states class, so description lookups don't
+    # need to scan the class dict
+    bycode = {}
+    for name, code in states.__dict__.items():
+        if not name.startswith('_'):
+            bycode[code] = name
+    return bycode
+
 class ProcessStates:
     STOPPED = 0
     STARTING = 10
@@ -34,12 +43,10 @@ RUNNING_STATES = (ProcessStates.RUNNING,
                   ProcessStates.BACKOFF,
                   ProcessStates.STARTING)
 
-
+_process_states_by_code = _names_by_code(ProcessStates)
 
 def getProcessStateDescription(code):
-    for statename in ProcessStates.__dict__:
-        if getattr(ProcessStates, statename) == code:
-            return statename
+    return _process_states_by_code.get(code)
 
 class SupervisorStates:
     FATAL = 2
@@ -47,11 +54,10 @@ class SupervisorStates:
     RESTARTING = 0
     SHUTDOWN = -1
 
-def getSupervisorStateDescription(code):
-    for statename in SupervisorStates.__dict__:
-        if getattr(SupervisorStates, statename) == code:
-            return statename
+_supervisor_states_by_code = _names_by_code(SupervisorStates)
 
+def getSupervisorStateDescription(code):
+    return _supervisor_states_by_code.get(code)
 
 class EventListenerStates:
     READY = 10 # the process ready to be sent an event from supervisor
@@ -59,8 +65,8 @@ class EventListenerStates:
     ACKNOWLEDGED = 30 # the event listener processed an event
     UNKNOWN = 40 # the event listener is in an unknown state
 
+_eventlistener_states_by_code = _names_by_code(EventListenerStates)
+
 def getEventListenerStateDescription(code):
-    for statename in EventListenerStates.__dict__:
-        if getattr(EventListenerStates, statename) == code:
-            return statename
+    return _eventlistener_states_by_code.get(code)
 
@@ -141,8 +141,7 @@ class Supervisor:
 
     def get_process_map(self):
         process_map = {}
-        pgroups = self.process_groups.values()
-        for group in pgroups:
+        for group in self.process_groups.itervalues():
             process_map.update(group.get_dispatchers())
         return process_map
 
@@ -232,7 +231,7 @@ class Supervisor:
                     raise
 
             for fd in r:
-                if combined_map.has_key(fd):
+                if fd in combined_map:
                     try:
                         dispatcher = combined_map[fd]
                         self.options.logger.blather(
@@ -245,7 +244,7 @@ class Supervisor:
                         combined_map[fd].handle_error()
 
             for fd in w:
-                if combined_map.has_key(fd):
+                if fd in combined_map:
                     try:
                         dispatcher = combined_map[fd]
                         self.options.logger.blather(
@@ -287,16 +286,19 @@ class Supervisor:
                 events.notify(event(this_tick, self))
 
     def reap(self, once=False):
-        pid, sts = self.options.waitpid()
-        if pid:
+        while 1:
+            pid, sts = self.options.waitpid()
+            if not pid:
+                break
             process = self.options.pidhistory.get(pid, None)
             if process is None:
                 self.options.logger.critical('reaped unknown pid %s)' % pid)
             else:
                 process.finish(pid, sts)
                 del self.options.pidhistory[pid]
-            if not once:
-                self.reap() # keep reaping until no more kids to reap
+            if once:
+                break
+            # otherwise keep reaping until no more kids to reap
 
     def handle_signal(self):
         if self.options.signal:
@@ -174,6 +174,9 @@ class DummyOptions:
     def close_fd(self, fd):
         self.fds_closed.append(fd)
 
+    def close_fds(self, low, high):
+        self.fds_closed.extend(range(low, high))
+
     def close_parent_pipes(self, pipes):
         self.parent_pipes_closed = pipes
 
@@ -1056,5 +1059,6 @@ def exception_handler(event, result):
     raise ValueError(result)
 
 def lstrip(s):
+    # keep this a list comprehension: generator expressions need Python 2.4
     strings = [x.strip() for x in s.split('\n')]
     return '\n'.join(strings)
@@ -1054,6 +1054,36 @@ class PEventListenerDispatcherTests(unittest.TestCase):
         dispatcher.close() # make sure we don't error if we try to close twice
         self.assertEqual(dispatcher.closed, True)
 
+class FindPrefixAtEndTests(unittest.TestCase):
+    def _callFUT(self, haystack, needle):
+        from supervisor.dispatchers import find_prefix_at_end
+        return find_prefix_at_end(haystack, needle)
+
+    def test_no_prefix(self):
+        self.assertEqual(self._callFUT('abcdef', '<!--XSUPERVISOR'), 0)
+
+    def test_empty_haystack(self):
+        self.assertEqual(self._callFUT('', '<!--XSUPERVISOR'), 0)
+
+    def test_partial_prefix(self):
+        self.assertEqual(self._callFUT('abc<!--X', '<!--XSUPERVISOR'), 5)
+
+    def test_longest_prefix_wins(self):
+        self.assertEqual(self._callFUT('abc<<<', '<<<<'), 3)
+
+    def test_first_char_in_tail_not_a_prefix(self):
+        self.assertEqual(self._callFUT('abc<a<!', '<!--'), 2)
+
+    def test_whole_needle_is_not_a_prefix(self):
+        self.assertEqual(self._callFUT('abc<!--', '<!--'), 0)
+
+    def test_agrees_with_endswith_scan(self):
+        needle = 'abab'
+        for haystack in ('', 'a', 'ab', 'aba', 'xaba', 'abab', 'bab', 'abb'):
+            expected = len(needle) - 1
+            while expected and not haystack.endswith(needle[:expected]):
+                expected -= 1
+            self.assertEqual(self._callFUT(haystack, needle), expected)
 
 def test_suite():
     return unittest.findTestCases(sys.modules[__name__])
@@ -108,6 +108,22 @@ class FileHandlerTests(HandlerTests, unittest.TestCase):
         content = open(self.filename, 'r').read()
         self.assertEqual(content, 'fi\xc3\xad')
 
+    def test_emit_message_only_skips_asdict(self):
+        handler = self._makeOne(self.filename)
+        record = self._makeLogRecord('hello!')
+        handler.emit(record)
+        self.assertEqual(record.dictrepr, None)
+        content = open(self.filename, 'r').read()
+        self.assertEqual(content, 'hello!')
+
+    def test_emit_with_levelname(self):
+        handler = self._makeOne(self.filename)
+        handler.setFormat('%(levelname)s %(message)s')
+        record = self._makeLogRecord('hello!')
+        handler.emit(record)
+        content = open(self.filename, 'r').read()
+        self.assertEqual(content, 'INFO hello!')
+
     def test_emit_error(self):
         handler = self._makeOne(self.filename)
         handler.stream = DummyStream(error=OSError)
@@ -173,6 +189,47 @@ class RotatingFileHandlerTests(FileHandlerTests):
         two = open(self.filename+ '.2','r').read()
         self.assertEqual(two, 'a'*12)
 
+    def test_doRollover_shifts_existing_backups(self):
+        for suffix in ('.1', '.3'):
+            f = open(self.filename + suffix, 'w')
+            f.write(suffix)
+            f.close()
+        handler = self._makeOne(self.filename, maxBytes=10, backupCount=3)
+        record = self._makeLogRecord('a' * 12)
+        handler.emit(record) # 12 bytes, do rollover
+        self.assertEqual(open(self.filename, 'r').read(), '')
+        self.assertEqual(open(self.filename + '.1', 'r').read(), 'a' * 12)
+        self.assertEqual(open(self.filename + '.2', 'r').read(), '.1')
+        self.assertEqual(open(self.filename + '.3', 'r').read(), '.3')
+        self.assertFalse(os.path.exists(self.filename + '.4'))
+
+    def test_ctor_size_counts_existing_file(self):
+        f = open(self.filename, 'w')
+        f.write('a' * 8)
+        f.close()
+        handler = self._makeOne(self.filename, maxBytes=10, backupCount=2)
+        self.assertEqual(handler.size, 8)
+        record = self._makeLogRecord('a' * 4)
+        handler.emit(record) # 12 bytes, do rollover
+        self.assertTrue(os.path.exists(self.filename + '.1'))
+        self.assertEqual(handler.size, 0)
+
+    def test_reopen_resets_size(self):
+        handler = self._makeOne(self.filename, maxBytes=10, backupCount=2)
+        record = self._makeLogRecord('a' * 4)
+        handler.emit(record)
+        self.assertEqual(handler.size, 4)
+        handler.remove()
+        handler.reopen()
+        self.assertEqual(handler.size, 0)
+
+    def test_emit_unicode_counts_encoded_bytes(self):
+        handler = self._makeOne(self.filename, maxBytes=100, backupCount=2)
+        record = self._makeLogRecord(u'fi\xe9')
+        handler.emit(record)
+        self.assertEqual(handler.size, 4)
+        self.assertEqual(handler.size, os.path.getsize(self.filename))
+
 class BoundIOTests(unittest.TestCase):
     def _getTargetClass(self):
         from supervisor.loggers import BoundIO
@@ -127,7 +127,7 @@ class ClientOptionsTests(unittest.TestCase):
         history_file=%s/sc_history
         """ % tempdir)
 
-        from StringIO import StringIO
+        from cStringIO import StringIO
         fp = StringIO(s)
         instance = self._makeOne()
         instance.configfile = fp
@@ -143,7 +143,7 @@ class ClientOptionsTests(unittest.TestCase):
         self.assertEqual(options.history_file, history_file)
 
     def test_options_unixsocket_cli(self):
-        from StringIO import StringIO
+        from cStringIO import StringIO
         fp = StringIO('[supervisorctl]')
         instance = self._makeOne()
         instance.configfile = fp
@@ -220,7 +220,7 @@ class ServerOptionsTests(unittest.TestCase):
 
         from supervisor import datatypes
 
-        from StringIO import StringIO
+        from cStringIO import StringIO
         fp = StringIO(s)
         instance = self._makeOne()
         instance.configfile = fp
@@ -442,6 +442,29 @@ class ServerOptionsTests(unittest.TestCase):
         else:
             raise AssertionError("Didn't raise")
 
+    def test_readFile_negative_offset(self):
+        from supervisor.options import readFile
+        fd, fn = tempfile.mkstemp()
+        try:
+            os.write(fd, 'abcdefghij')
+            os.close(fd)
+            self.assertEqual(readFile(fn, -3, 0), 'hij')
+            self.assertEqual(readFile(fn, -20, 0), 'abcdefghij')
+        finally:
+            os.remove(fn)
+
+    def test_tailFile(self):
+        from supervisor.options import tailFile
+        fd, fn = tempfile.mkstemp()
+        try:
+            os.write(fd, 'abcdefghij')
+            os.close(fd)
+            self.assertEqual(tailFile(fn, 0, 4), ['ghij', 10, True])
+            self.assertEqual(tailFile(fn, 8, 4), ['ghij', 10, False])
+            self.assertEqual(tailFile(fn, 10, 4), ['', 10, False])
+        finally:
+            os.remove(fn)
+
     def test_get_pid(self):
         instance = self._makeOne()
         self.assertEqual(os.getpid(), instance.get_pid())
@@ -467,10 +490,9 @@ class ServerOptionsTests(unittest.TestCase):
                           ['/'], os.stat('/'))
 
     def test_cleanup_afunix_unlink(self):
-        fn = tempfile.mktemp()
-        f = open(fn, 'w')
-        f.write('foo')
-        f.close()
+        fd, fn = tempfile.mkstemp()
+        os.write(fd, 'foo')
+        os.close(fd)
         instance = self._makeOne()
         class Port:
             family = socket.AF_UNIX
@@ -484,11 +506,10 @@ class ServerOptionsTests(unittest.TestCase):
         self.failIf(os.path.exists(fn))
 
     def test_cleanup_afunix_nounlink(self):
-        fn = tempfile.mktemp()
+        fd, fn = tempfile.mkstemp()
         try:
-            f = open(fn, 'w')
-            f.write('foo')
-            f.close()
+            os.write(fd, 'foo')
+            os.close(fd)
             instance = self._makeOne()
             class Port:
                 family = socket.AF_UNIX
@@ -562,6 +583,14 @@ class ServerOptionsTests(unittest.TestCase):
         instance.close_fd(outie)
         self.assertRaises(OSError, os.write, outie, 'foo')
 
+    def test_close_fds(self):
+        instance = self._makeOne()
+        innie, outie = os.pipe()
+        instance.close_fds(innie, innie + 1)
+        self.assertRaises(OSError, os.read, innie, 0)
+        instance.close_fds(outie, outie + 1)
+        self.assertRaises(OSError, os.write, outie, 'foo')
+
     def test_processes_from_section(self):
         instance = self._makeOne()
         text = lstrip("""\
@@ -1043,6 +1072,22 @@ class ServerOptionsTests(unittest.TestCase):
         finally:
             shutil.rmtree(dn)
 
+    def test_clear_autochildlogdir_identifier_with_regex_chars(self):
+        dn = tempfile.mkdtemp()
+        try:
+            instance = self._makeOne()
+            instance.childlogdir = dn
+            sid = 'super+visor'
+            instance.identifier = sid
+            logfn = instance.get_autochildlog_name('foo', sid,'stdout')
+            first = logfn + '.1'
+            open(first, 'w')
+            instance.clear_autochildlogdir()
+            self.failIf(os.path.exists(logfn))
+            self.failIf(os.path.exists(first))
+        finally:
+            shutil.rmtree(dn)
+
     def test_clear_autochildlog_oserror(self):
         instance = self._makeOne()
         instance.childlogdir = '/tmp/this/cant/possibly/existjjjj'
@@ -1337,6 +1382,31 @@ class FastCGIGroupConfigTests(unittest.TestCase):
         self.assertTrue(instance1 != instance2)
         self.assertFalse(instance1 == instance2)
 
+class UnhosedConfigParserTests(unittest.TestCase):
+    def _makeOne(self, s):
+        from supervisor.options import UnhosedConfigParser
+        config = UnhosedConfigParser()
+        config.read_string(s)
+        return config
+
+    def test_saneget(self):
+        config = self._makeOne('[foo]\nbar=baz\n')
+        self.assertEqual(config.saneget('foo', 'bar'), 'baz')
+        self.assertEqual(config.saneget('foo', 'bar', 'default'), 'baz')
+        self.assertEqual(config.saneget('foo', 'missing', 'default'),
+                         'default')
+        self.assertEqual(config.saneget('foo', 'missing', None), None)
+
+    def test_saneget_no_default_raises(self):
+        from ConfigParser import NoOptionError
+        config = self._makeOne('[foo]\nbar=baz\n')
+        self.assertRaises(NoOptionError, config.saneget, 'foo', 'missing')
+
+    def test_getdefault(self):
+        config = self._makeOne('[supervisord]\nbar=baz\n')
+        self.assertEqual(config.getdefault('bar'), 'baz')
+        self.assertEqual(config.getdefault('missing', 'default'), 'default')
+
 class UtilFunctionsTests(unittest.TestCase):
     def test_make_namespec(self):
         from supervisor.options import make_namespec
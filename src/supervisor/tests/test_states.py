@@ -25,6 +25,12 @@ class TopLevelProcessStateTests(unittest.TestCase):
         self.assertEqual(states.getProcessStateDescription(3.14159),
             None)
 
+    def test_getProcessStateDescription_ignores_class_attributes(self):
+        self.assertEqual(states.getProcessStateDescription(None), None)
+        self.assertEqual(
+            states.getProcessStateDescription(states.ProcessStates.__module__),
+            None)
+
 class TopLevelSupervisorStateTests(unittest.TestCase):
     def test_module_has_supervisor_states(self):
         self.assertTrue(hasattr(states, 'SupervisorStates'))
@@ -110,6 +110,23 @@ class SupervisordTests(unittest.TestCase):
         supervisord.reap(once=True)
         self.assertEqual(process.finished, (1,1))
 
+    def test_reap_until_no_more_children(self):
+        options = DummyOptions()
+        results = [(1, 1), (2, 2), (None, None)]
+        options.waitpid = lambda: results.pop(0)
+        pconfig1 = DummyPConfig(options, 'process1', '/bin/process1')
+        process1 = DummyProcess(pconfig1)
+        pconfig2 = DummyPConfig(options, 'process2', '/bin/process2')
+        process2 = DummyProcess(pconfig2)
+        options.pidhistory = {1:process1, 2:process2}
+        supervisord = self._makeOne(options)
+
+        supervisord.reap()
+        self.assertEqual(process1.finished, (1,1))
+        self.assertEqual(process2.finished, (2,2))
+        self.assertEqual(options.pidhistory, {})
+        self.assertEqual(results, [])
+
     def test_handle_sigterm(self):
         options = DummyOptions()
         options.signal = signal.SIGTERM